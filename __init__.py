@@ -8,7 +8,13 @@ Uses Google ADK for AI interaction and OR-Tools for constraint satisfaction.
 __version__ = "0.1.0"
 __author__ = "Daniel"
 
-from .agents.agent import root_agent
-
 __all__ = ["root_agent"]
 
+
+def __getattr__(name):
+    # Defer building the agent until it is actually requested
+    if name == 'root_agent':
+        from .agents.agent import root_agent
+        return root_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
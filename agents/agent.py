@@ -5,87 +5,47 @@ AI agent that helps teachers create optimal seating arrangements.
 Supports multiple languages (English, Swedish, etc.)
 """
 
-from google.adk.agents.llm_agent import Agent
-import sys
+import importlib
 import os
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-from tools import optimize_seating, validate_constraints, explain_solution
+from functools import lru_cache
+
+try:
+    from ..tools import optimize_seating, validate_constraints, explain_solution
+except ImportError:
+    # Loaded as a top-level package (e.g. `adk web .`), which puts the
+    # repository root on sys.path itself
+    from tools import optimize_seating, validate_constraints, explain_solution
 
 # Get language from environment variable (default: English)
 LANGUAGE = os.getenv('OPTIMIZER_LANGUAGE', 'en').lower()
 
-# Language-specific instructions
-INSTRUCTIONS = {
-    'en': """You are Classroom Optimizer, an AI assistant for teachers. Your goal is to help create optimal seating arrangements for classrooms based on student needs and constraints.
-
-Your process:
-1. **Understand the Classroom**: Get classroom dimensions (rows, columns) and number of students
-2. **Collect Student Information**: Names and any special considerations
-3. **Gather Constraints**: Ask about:
-   - Students who cannot sit together
-   - Students who need front row seats
-   - Students who need to be near doors/windows
-   - Students who cannot be by windows/doors
-   - Students who need quiet areas
-   - Any other special requirements
-
-4. **Generate Solutions**: Use the optimization tools to create seating arrangements
-5. **Explain Results**: Clearly explain why the arrangement works and how constraints are satisfied
-6. **Iterate**: If the teacher wants changes, adjust and regenerate
-
-Key principles:
-- Be helpful and understanding of classroom management challenges
-- Explain your reasoning clearly
-- Offer multiple solutions when possible
-- Consider pedagogical best practices
-- Be flexible and adapt to teacher feedback
-
-Use the available tools to validate constraints and generate optimal seating arrangements. Always communicate in English.""",
-    
-    'sv': """Du är Klassrumsoptimeraren, en AI-assistent för lärare. Ditt mål är att hjälpa till att skapa optimala sittplatser för klassrum baserat på elevers behov och begränsningar.
-
-Din process:
-1. **Förstå klassrummet**: Få klassrumsdimensioner (rader, kolumner) och antal elever
-2. **Samla elevinfo**: Namn och särskilda överväganden
-3. **Samla begränsningar**: Fråga om:
-   - Elever som inte kan sitta tillsammans
-   - Elever som behöver främre raden
-   - Elever som behöver vara nära dörrar/fönster
-   - Elever som inte kan vara vid fönster/dörrar
-   - Elever som behöver tyst miljö
-   - Andra särskilda krav
-
-4. **Generera lösningar**: Använd optimeringsverktygen för att skapa sittplatser
-5. **Förklara resultat**: Förklara tydligt varför arrangemanget fungerar och hur begränsningar uppfylls
-6. **Iterera**: Om läraren vill ha ändringar, justera och regenerera
 
-Viktiga principer:
-- Var hjälpsam och förstående för klassrumshanteringsutmaningar
-- Förklara ditt resonemang tydligt
-- Erbjud flera lösningar när det är möjligt
-- Överväg pedagogiska bästa praxis
-- Var flexibel och anpassa dig till lärarens feedback
+def _load_language():
+    """Import the strings for the current language only (fallback to English)."""
+    try:
+        return importlib.import_module(f'._lang_{LANGUAGE}', __package__)
+    except ImportError:
+        return importlib.import_module('._lang_en', __package__)
 
-Använd de tillgängliga verktygen för att validera begränsningar och generera optimala sittplatser. Kommunicera alltid på svenska.""",
-}
 
-DESCRIPTIONS = {
-    'en': "An AI-powered classroom seating optimization tool that helps teachers create optimal arrangements based on student needs and constraints.",
-    'sv': "Ett AI-drivet verktyg för klassrumsoptimering som hjälper lärare att skapa optimala sittplatser baserat på elevers behov och begränsningar.",
-}
+@lru_cache(maxsize=1)
+def _build_agent():
+    """Build the Classroom Optimizer agent on first use."""
+    from google.adk.agents.llm_agent import Agent
 
-# Get instructions and description for current language (fallback to English)
-instruction = INSTRUCTIONS.get(LANGUAGE, INSTRUCTIONS['en'])
-description = DESCRIPTIONS.get(LANGUAGE, DESCRIPTIONS['en'])
+    language = _load_language()
+    return Agent(
+        model='gemini-2.5-flash',
+        name='classroom-optimizer',
+        description=language.DESCRIPTION,
+        instruction=language.INSTRUCTION,
+        tools=[optimize_seating, validate_constraints, explain_solution],
+    )
 
-# Main Classroom Optimizer agent
-# This is the root_agent that ADK will discover and use
-root_agent = Agent(
-    model='gemini-2.5-flash',
-    name='classroom-optimizer',
-    description=description,
-    instruction=instruction,
-    tools=[optimize_seating, validate_constraints, explain_solution],
-)
 
+def __getattr__(name):
+    # Main Classroom Optimizer agent
+    # This is the root_agent that ADK will discover and use
+    if name == 'root_agent':
+        return _build_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
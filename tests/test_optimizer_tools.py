@@ -0,0 +1,97 @@
+"""Tests for the seating optimization tools."""
+
+from tools import optimize_seating, validate_constraints
+
+
+def make_students(count):
+    return [{"id": i, "name": f"Student {i}"} for i in range(count)]
+
+
+def positions(seating_chart):
+    """Map student id -> (row, col) from a seating chart."""
+    return {
+        cell["id"]: (row, col)
+        for row, row_cells in enumerate(seating_chart)
+        for col, cell in enumerate(row_cells)
+        if cell
+    }
+
+
+def test_no_constraints_fills_row_major_without_solver():
+    result = optimize_seating({"rows": 2, "columns": 3}, make_students(4), [])
+
+    assert result["success"]
+    assert result["statistics"]["solve_time_seconds"] == 0.0
+    assert positions(result["seating_chart"]) == {
+        0: (0, 0), 1: (0, 1), 2: (0, 2), 3: (1, 0)
+    }
+
+
+def test_cannot_sit_together_keeps_students_apart():
+    constraints = [{"type": "cannot_sit_together", "student1": 0, "student2": 1}]
+    result = optimize_seating({"rows": 2, "columns": 3}, make_students(2), constraints)
+
+    assert result["success"]
+    (row1, col1), (row2, col2) = (positions(result["seating_chart"])[i] for i in (0, 1))
+    assert max(abs(row1 - row2), abs(col1 - col2)) >= 2
+
+
+def test_seat_restrictions():
+    constraints = [
+        {"type": "must_front_row", "student": 0},
+        {"type": "cannot_back_row", "student": 1},
+        {"type": "cannot_by_window", "student": 2},
+        {"type": "cannot_by_door", "student": 3},
+    ]
+    result = optimize_seating({"rows": 3, "columns": 3}, make_students(9), constraints)
+
+    assert result["success"]
+    placed = positions(result["seating_chart"])
+    assert len(placed) == 9
+    assert placed[0][0] == 0
+    assert placed[1][0] != 2
+    assert placed[2][1] != 2
+    assert placed[3][1] != 0
+
+
+def test_near_door_and_near_window_are_optimized():
+    constraints = [
+        {"type": "near_door", "student": 0},
+        {"type": "near_window", "student": 1},
+    ]
+    result = optimize_seating({"rows": 2, "columns": 4}, make_students(3), constraints)
+
+    assert result["status"] == "optimal"
+    placed = positions(result["seating_chart"])
+    assert placed[0][1] == 0
+    assert placed[1][1] == 3
+
+
+def test_infeasible_constraints_are_reported():
+    constraints = [{"type": "cannot_sit_together", "student1": 0, "student2": 1}]
+    result = optimize_seating({"rows": 1, "columns": 2}, make_students(2), constraints)
+
+    assert not result["success"]
+    assert result["status"] == "infeasible"
+    assert result["seating_chart"] is None
+
+
+def test_too_many_front_row_students_rejected_before_solving():
+    constraints = [{"type": "must_front_row", "student": i} for i in range(3)]
+
+    validation = validate_constraints({"rows": 2, "columns": 2}, 3, constraints)
+    assert not validation["valid"]
+
+    result = optimize_seating({"rows": 2, "columns": 2}, make_students(3), constraints)
+    assert result["status"] == "infeasible"
+    assert result["message"] == validation["errors"][0]
+
+
+def test_time_limit_reached_reports_timeout():
+    constraints = [{"type": "must_front_row", "student": 0}]
+    result = optimize_seating(
+        {"rows": 2, "columns": 2}, make_students(2), constraints, time_limit=0
+    )
+
+    assert not result["success"]
+    assert result["status"] == "timeout"
@@ -5,10 +5,32 @@ Classroom Optimization Tools
 Uses Google OR-Tools for constraint satisfaction and seating optimization.
 """
 
+import os
+from collections import Counter
+from functools import lru_cache
 from typing import Any, Dict, List
 from ortools.sat.python import cp_model
 
 
+@lru_cache(maxsize=32)
+def _seat_groups(rows: int, columns: int):
+    """
+    Seat index groups for a classroom size, reused across solves.
+    
+    Returns:
+        Tuple of frozensets: all seats, front row, back row, window column
+        and door column
+    """
+    num_seats = rows * columns
+    return (
+        frozenset(range(num_seats)),
+        frozenset(range(columns)),
+        frozenset(range((rows - 1) * columns, num_seats)),
+        frozenset(r * columns + columns - 1 for r in range(rows)),
+        frozenset(r * columns for r in range(rows)),
+    )
+
+
 def validate_constraints(
     classroom_size: Dict[str, int],
     num_students: int,
@@ -49,25 +71,38 @@ def validate_constraints(
         return validation_result
     
     # Count constraint types
-    constraint_counts = {}
-    front_row_requirements = 0
-    back_row_exclusions = 0
+    constraint_counts = Counter(c.get('type', 'unknown') for c in constraints)
     
+    # Distinct students per seat-restricting constraint type
+    students_by_type = {}
     for constraint in constraints:
-        constraint_type = constraint.get('type', 'unknown')
-        constraint_counts[constraint_type] = constraint_counts.get(constraint_type, 0) + 1
-        
-        if constraint_type == 'must_front_row':
-            front_row_requirements += 1
-        elif constraint_type == 'cannot_back_row':
-            back_row_exclusions += 1
+        if 'student' in constraint:
+            students_by_type.setdefault(constraint.get('type'), set()).add(constraint['student'])
+    
+    front_row_students = students_by_type.get('must_front_row', set())
+    front_row_requirements = len(front_row_students)
+    back_row_exclusions = len(students_by_type.get('cannot_back_row', set()))
     
     # Check front row capacity
     if front_row_requirements > columns:
-        validation_result["warnings"].append(
+        validation_result["valid"] = False
+        validation_result["errors"].append(
             f"Front row has only {columns} seats but {front_row_requirements} students require it"
         )
     
+    # With two or fewer columns every seat is by the door or the window
+    if columns <= 2:
+        no_seat_students = (
+            students_by_type.get('cannot_by_window', set())
+            & students_by_type.get('cannot_by_door', set())
+        )
+        if no_seat_students:
+            validation_result["valid"] = False
+            validation_result["errors"].append(
+                f"Students {sorted(no_seat_students, key=str)} cannot sit by the door or the window, "
+                f"but with {columns} columns every seat is next to one of them"
+            )
+    
     # Check if too many students exclude back row
     non_back_row_seats = (rows - 1) * columns
     if back_row_exclusions + front_row_requirements > non_back_row_seats:
@@ -75,7 +110,7 @@ def validate_constraints(
             "Too many students excluding back row - may be difficult to satisfy"
         )
     
-    validation_result["constraint_summary"] = constraint_counts
+    validation_result["constraint_summary"] = dict(constraint_counts)
     
     return validation_result
 
@@ -83,7 +118,8 @@ def validate_constraints(
 def optimize_seating(
     classroom_layout: Dict[str, int],
     students: List[Dict[str, Any]],
-    constraints: List[Dict[str, Any]]
+    constraints: List[Dict[str, Any]],
+    time_limit: float = 5.0
 ) -> Dict[str, Any]:
     """
     Generate optimal seating arrangement using OR-Tools constraint satisfaction.
@@ -92,116 +128,207 @@ def optimize_seating(
         classroom_layout: Dict with 'rows' and 'columns'
         students: List of student dicts with 'id' and 'name'
         constraints: List of constraint dicts with 'type' and relevant student IDs
+        time_limit: Solver time limit in seconds (default 5)
         
     Returns:
         Dict with seating arrangement and satisfaction info
     """
     rows = classroom_layout.get('rows', 5)
     columns = classroom_layout.get('columns', 6)
+    time_limit = 5.0 if time_limit is None else float(time_limit)
     num_students = len(students)
     
-    # Create the CP-SAT model
-    model = cp_model.CpModel()
+    # Reject inputs that are infeasible on their face without building a model
+    validation = validate_constraints(
+        {'rows': rows, 'columns': columns}, num_students, constraints
+    )
+    if not validation["valid"]:
+        return {
+            "success": False,
+            "status": "infeasible",
+            "message": validation["errors"][0],
+            "seating_chart": None
+        }
+    
+    # Without constraints any row-major fill is valid - skip the solver
+    if not constraints:
+        seating_chart = [[None] * columns for _ in range(rows)]
+        
+        for i, student in enumerate(students):
+            row, col = divmod(i, columns)
+            seating_chart[row][col] = {
+                "id": student['id'],
+                "name": student['name']
+            }
+        
+        return {
+            "success": True,
+            "status": "optimal",
+            "seating_chart": seating_chart,
+            "layout": {"rows": rows, "columns": columns},
+            "statistics": {
+                "solve_time_seconds": 0.0,
+                "constraints_satisfied": len(constraints)
+            }
+        }
     
-    # Decision variables: seat[student_id, row, col] = 1 if student sits there
-    seats = {}
-    for student in students:
-        student_id = student['id']
-        for row in range(rows):
-            for col in range(columns):
-                seats[(student_id, row, col)] = model.NewBoolVar(
-                    f'seat_s{student_id}_r{row}_c{col}'
-                )
-    
-    # Constraint: Each student sits in exactly one seat
-    for student in students:
-        student_id = student['id']
-        model.Add(sum(seats[(student_id, r, c)] 
-                     for r in range(rows) 
-                     for c in range(columns)) == 1)
-    
-    # Constraint: Each seat has at most one student
-    for row in range(rows):
-        for col in range(columns):
-            model.Add(sum(seats[(s['id'], row, col)] for s in students) <= 1)
+    # Seat index = row * columns + col
+    all_seats, front_row_seats, back_row_seats, window_seats, door_seats = (
+        _seat_groups(rows, columns)
+    )
     
-    # Apply custom constraints
+    # Seats each student may occupy
+    student_ids = [student['id'] for student in students]
+    allowed_seats = {student_id: set(all_seats) for student_id in student_ids}
+    
+    # Seat-restricting constraints shrink the student's domain up front
     for constraint in constraints:
         constraint_type = constraint.get('type')
         
-        if constraint_type == 'cannot_sit_together':
-            # Students cannot sit adjacent (including diagonals)
-            student1_id = constraint.get('student1')
-            student2_id = constraint.get('student2')
-            
-            for row in range(rows):
-                for col in range(columns):
-                    # Get adjacent positions
-                    adjacent = []
-                    for dr in [-1, 0, 1]:
-                        for dc in [-1, 0, 1]:
-                            if dr == 0 and dc == 0:
-                                continue
-                            new_row, new_col = row + dr, col + dc
-                            if 0 <= new_row < rows and 0 <= new_col < columns:
-                                adjacent.append((new_row, new_col))
-                    
-                    # If student1 sits here, student2 cannot sit in adjacent seats
-                    for adj_row, adj_col in adjacent:
-                        model.AddBoolOr([
-                            seats[(student1_id, row, col)].Not(),
-                            seats[(student2_id, adj_row, adj_col)].Not()
-                        ])
-        
-        elif constraint_type == 'must_front_row':
+        if constraint_type == 'must_front_row':
             # Student must sit in front row (row 0)
             student_id = constraint.get('student')
-            model.Add(sum(seats[(student_id, 0, c)] for c in range(columns)) == 1)
+            allowed_seats[student_id] &= front_row_seats
         
         elif constraint_type == 'cannot_back_row':
             # Student cannot sit in back row
             student_id = constraint.get('student')
-            model.Add(sum(seats[(student_id, rows-1, c)] for c in range(columns)) == 0)
+            allowed_seats[student_id] -= back_row_seats
         
-        elif constraint_type == 'near_door':
-            # Prefer seats near door (assuming door is at col 0)
+        elif constraint_type == 'cannot_by_window':
+            # Cannot sit by window (col = columns-1)
             student_id = constraint.get('student')
-            # Add preference for column 0 or 1
-            # This is a soft constraint - could be weighted
-            pass  # Simplified for now
+            allowed_seats[student_id] -= window_seats
         
-        elif constraint_type == 'near_window':
-            # Prefer seats near window (assuming window is at col = columns-1)
+        elif constraint_type == 'cannot_by_door':
+            # Cannot sit by door (col 0)
             student_id = constraint.get('student')
-            pass  # Simplified for now
+            allowed_seats[student_id] -= door_seats
+    
+    # Create the CP-SAT model
+    model = cp_model.CpModel()
+    
+    # Decision variables: pos[student_id] = seat index of the student
+    pos = {}
+    for student_id in student_ids:
+        pos[student_id] = model.NewIntVarFromDomain(
+            cp_model.Domain.FromValues(sorted(allowed_seats[student_id])),
+            f'pos_s{student_id}'
+        )
+    
+    # Constraint: No two students share a seat
+    model.AddAllDifferent(list(pos.values()))
+    
+    # Symmetry breaking: students mentioned by exactly the same constraints
+    # are interchangeable, so only keep the arrangement where their seat
+    # indices follow the order of the student list
+    signatures = {student_id: set() for student_id in student_ids}
+    for i, constraint in enumerate(constraints):
+        for key in ('student', 'student1', 'student2'):
+            if constraint.get(key) in signatures:
+                signatures[constraint[key]].add(i)
+    
+    groups = {}
+    for student_id in student_ids:
+        groups.setdefault(frozenset(signatures[student_id]), []).append(student_id)
+    
+    for group in groups.values():
+        for first, second in zip(group, group[1:]):
+            model.Add(pos[first] < pos[second])
+    
+    # Row/column views of a student's seat, created on first use
+    row_vars = {}
+    col_vars = {}
+    
+    def student_row(student_id):
+        if student_id not in row_vars:
+            row_var = model.NewIntVar(0, rows - 1, f'row_s{student_id}')
+            model.AddDivisionEquality(row_var, pos[student_id], columns)
+            row_vars[student_id] = row_var
+        return row_vars[student_id]
+    
+    def student_col(student_id):
+        if student_id not in col_vars:
+            col_var = model.NewIntVar(0, columns - 1, f'col_s{student_id}')
+            model.AddModuloEquality(col_var, pos[student_id], columns)
+            col_vars[student_id] = col_var
+        return col_vars[student_id]
+    
+    # Unordered student pairs that already have a separation constraint
+    separated_pairs = set()
+    
+    # Soft constraint penalties, minimized as the objective
+    objective_terms = []
+    
+    # Apply custom constraints
+    for i, constraint in enumerate(constraints):
+        constraint_type = constraint.get('type')
         
-        elif constraint_type == 'cannot_by_window':
-            # Cannot sit by window
+        if constraint_type == 'cannot_sit_together':
+            # Students cannot sit adjacent (including diagonals):
+            # their Chebyshev distance must be at least 2
+            student1_id = constraint.get('student1')
+            student2_id = constraint.get('student2')
+            
+            # A student cannot be adjacent to themselves
+            if student1_id == student2_id:
+                continue
+            
+            # (a, b) and (b, a) are the same constraint - post it only once
+            pair = frozenset((student1_id, student2_id))
+            if pair in separated_pairs:
+                continue
+            separated_pairs.add(pair)
+            
+            row_dist = model.NewIntVar(0, rows - 1, f'row_dist_{i}')
+            col_dist = model.NewIntVar(0, columns - 1, f'col_dist_{i}')
+            model.AddAbsEquality(row_dist, student_row(student1_id) - student_row(student2_id))
+            model.AddAbsEquality(col_dist, student_col(student1_id) - student_col(student2_id))
+            distance = model.NewIntVar(0, max(rows, columns) - 1, f'dist_{i}')
+            model.AddMaxEquality(distance, [row_dist, col_dist])
+            model.Add(distance >= 2)
+        
+        elif constraint_type == 'near_door':
+            # Prefer seats near door (assuming door is at col 0)
+            # Soft constraint - penalize distance from the door column
             student_id = constraint.get('student')
-            model.Add(sum(seats[(student_id, r, columns-1)] for r in range(rows)) == 0)
+            if student_id in pos:
+                objective_terms.append(student_col(student_id))
         
-        elif constraint_type == 'cannot_by_door':
-            # Cannot sit by door
+        elif constraint_type == 'near_window':
+            # Prefer seats near window (assuming window is at col = columns-1)
+            # Soft constraint - penalize distance from the window column
             student_id = constraint.get('student')
-            model.Add(sum(seats[(student_id, r, 0)] for r in range(rows)) == 0)
+            if student_id in pos:
+                objective_terms.append(columns - 1 - student_col(student_id))
+    
+    # Only optimize when there are preferences; otherwise a feasible
+    # arrangement is all we need
+    if objective_terms:
+        model.Minimize(sum(objective_terms))
     
     # Solve the model
     solver = cp_model.CpSolver()
+    solver.parameters.num_workers = min(8, os.cpu_count() or 1)
+    solver.parameters.max_time_in_seconds = time_limit
+    solver.parameters.log_search_progress = False
+    # Small assignment models: skip LP relaxation unless there is an
+    # objective for it to bound
+    solver.parameters.cp_model_presolve = True
+    solver.parameters.linearization_level = 1 if objective_terms else 0
+    solver.parameters.boolean_encoding_level = 0
     status = solver.Solve(model)
     
     # Extract solution
     if status in [cp_model.OPTIMAL, cp_model.FEASIBLE]:
-        seating_chart = [[None for _ in range(columns)] for _ in range(rows)]
+        seating_chart = [[None] * columns for _ in range(rows)]
         
-        for student in students:
-            student_id = student['id']
-            for row in range(rows):
-                for col in range(columns):
-                    if solver.Value(seats[(student_id, row, col)]):
-                        seating_chart[row][col] = {
-                            "id": student_id,
-                            "name": student['name']
-                        }
+        for student_id, student in zip(student_ids, students):
+            row, col = divmod(solver.Value(pos[student_id]), columns)
+            seating_chart[row][col] = {
+                "id": student_id,
+                "name": student['name']
+            }
         
         return {
             "success": True,
@@ -213,6 +340,13 @@ def optimize_seating(
                 "constraints_satisfied": len(constraints)
             }
         }
+    elif status == cp_model.UNKNOWN:
+        return {
+            "success": False,
+            "status": "timeout",
+            "message": f"No seating arrangement found within the {time_limit:g} second time limit. Try a longer time limit or fewer constraints.",
+            "seating_chart": None
+        }
     else:
         return {
             "success": False,
@@ -239,15 +373,14 @@ def explain_solution(
     explanations = []
     
     rows = len(seating_chart)
-    columns = len(seating_chart[0]) if rows > 0 else 0
     
     # Find student positions
-    student_positions = {}
-    for row in range(rows):
-        for col in range(columns):
-            if seating_chart[row][col]:
-                student_id = seating_chart[row][col]['id']
-                student_positions[student_id] = (row, col)
+    student_positions = {
+        cell['id']: (row, col)
+        for row, row_cells in enumerate(seating_chart)
+        for col, cell in enumerate(row_cells)
+        if cell
+    }
     
     # Explain each constraint
     for i, constraint in enumerate(constraints, 1):
@@ -258,9 +391,9 @@ def explain_solution(
             student2_id = constraint.get('student2')
             
             if student1_id in student_positions and student2_id in student_positions:
-                pos1 = student_positions[student1_id]
-                pos2 = student_positions[student2_id]
-                distance = max(abs(pos1[0] - pos2[0]), abs(pos1[1] - pos2[1]))
+                row1, col1 = student_positions[student1_id]
+                row2, col2 = student_positions[student2_id]
+                distance = max(abs(row1 - row2), abs(col1 - col2))
                 
                 explanations.append({
                     "constraint": f"Students {student1_id} and {student2_id} cannot sit together",